@@ -9,7 +9,7 @@ from yaralyzer.util.logging import log
 
 from pdfalyzer.helpers.pdf_object_helper import pypdf_class_name
 from pdfalyzer.helpers.rich_text_helper import comma_join_txt, node_label
-from pdfalyzer.helpers.string_helper import root_address
+from pdfalyzer.helpers.string_helper import intern_if_str, root_address
 from pdfalyzer.output.styles.node_colors import get_class_style, get_class_style_dim
 from pdfalyzer.util.adobe_strings import *
 
@@ -51,6 +51,9 @@ class PdfObjectProperties:
         if isinstance(self.label, int):
             self.label = f"{UNLABELED}[{self.label}]"
 
+        # The same few labels repeat across every node so share one copy
+        self.label = intern_if_str(self.label)
+
         # TODO: this is hacky/temporarily incorrect bc we often don't know the parent when node is being constructed
         if isinstance(address, int):
             self.first_address = f"[{address}]"
@@ -3,10 +3,11 @@ Class to help with the pre-configured YARA rules in the /yara directory.
 """
 from importlib.resources import as_file, files
 from sys import exit
-from typing import Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
+import yara
 from yaralyzer.config import YaralyzerConfig
-from yaralyzer.yaralyzer import Yaralyzer
+from yaralyzer.yaralyzer import YARA_FILE_DOES_NOT_EXIST_ERROR_MSG, Yaralyzer
 
 from pdfalyzer.config import PdfalyzerConfig
 
@@ -18,6 +19,10 @@ YARA_RULES_FILES = [
     'PDF_binary_stream.yara',
 ]
 
+# Every stream gets its own Yaralyzer but they all use the same rules so only compile them once per process.
+# Keys are tuples of rules file paths, values are (compiled rules, rules label) tuples.
+_compiled_rules_cache: Dict[Tuple[str, ...], Tuple[yara.Rules, str]] = {}
+
 
 def get_file_yaralyzer(file_path_to_scan: str) -> Yaralyzer:
     """Get a yaralyzer for a file path"""
@@ -35,17 +40,31 @@ def _build_yaralyzer(scannable: Union[bytes, str], label: Optional[str] = None)
         with as_file(YARA_RULES_DIR.joinpath(YARA_RULES_FILES[1])) as yara1:
             with as_file(YARA_RULES_DIR.joinpath(YARA_RULES_FILES[2])) as yara2:
                 # If there is a custom yara_rules argument file use that instead of the files in the yara_rules/ dir
-                rules_paths = YaralyzerConfig.args.yara_rules_files or []
+                rules_paths = list(YaralyzerConfig.args.yara_rules_files or [])
 
                 if not YaralyzerConfig.args.no_default_yara_rules:
                     rules_paths += [str(y) for y in [yara0, yara1, yara2]]
 
                 try:
-                    return Yaralyzer.for_rules_files(rules_paths, scannable, label)
+                    return _cached_yaralyzer(rules_paths, scannable, label)
                 except ValueError as e:
-                    # TODO: use YARA_FILE_DOES_NOT_EXIST_ERROR_MSG variable
-                    if "it doesn't exist" in str(e):
+                    if YARA_FILE_DOES_NOT_EXIST_ERROR_MSG in str(e):
                         print(str(e))
                         exit(1)
                     else:
                         raise e
+
+
+def _cached_yaralyzer(rules_paths: List[str], scannable: Union[bytes, str], label: Optional[str]) -> Yaralyzer:
+    """
+    Yaralyzer.for_rules_files() compiles the rules every time it's called so only call it the first time
+    a given list of rules files is seen and reuse its compiled rules for every Yaralyzer after that.
+    """
+    cache_key = tuple(rules_paths)
+
+    if cache_key in _compiled_rules_cache:
+        return Yaralyzer(*_compiled_rules_cache[cache_key], scannable, label)
+
+    yaralyzer = Yaralyzer.for_rules_files(rules_paths, scannable, label)
+    _compiled_rules_cache[cache_key] = (yaralyzer.rules, yaralyzer.rules_label)
+    return yaralyzer
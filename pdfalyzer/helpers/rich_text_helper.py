@@ -1,6 +1,7 @@
 """
 Functions for miscellaneous Rich text/string operations.
 """
+from functools import lru_cache
 from typing import List, Union
 
 from pypdf.generic import PdfObject
@@ -57,5 +58,11 @@ def number_and_pct(_number: int, total: int, digits: int = 1) -> Text:
 
 
 def pct_txt(_number: int, total: int, digits: int = 1) -> Text:
+    """Return e.g. '(80.0%)'. Text is mutable so only the formatted string is cached."""
+    return Text(_pct_str(_number, total, digits), style='blue')
+
+
+@lru_cache(maxsize=4096)
+def _pct_str(_number: int, total: int, digits: int) -> str:
     pct = (100 * float(_number) / float(total)).__round__(digits)
-    return Text(f"({pct}%)", style='blue')
+    return f"({pct}%)"
@@ -2,8 +2,9 @@
 Various text formatting/styling/manipulating methods.
 """
 import re
+import sys
 from pprint import PrettyPrinter
-from typing import List, Pattern, Union
+from typing import Any, List, Pattern, Union
 
 from yaralyzer.output.rich_console import console_width
 
@@ -46,7 +47,7 @@ def root_address(_string: str) -> str:
 
 def is_prefixed_by_any(_string: str, prefixes: List[str]) -> bool:
     """Returns True if _string starts with anything in 'prefixes'."""
-    return any([_string.startswith(prefix) for prefix in prefixes])
+    return _string.startswith(tuple(prefixes))
 
 
 def bracketed(index: Union[int, str]) -> str:
@@ -54,6 +55,11 @@ def bracketed(index: Union[int, str]) -> str:
     return f"[{index}]"
 
 
+def intern_if_str(value: Any) -> Any:
+    """sys.intern() value if it's a str. str subclasses like pypdf's NameObject can't be interned."""
+    return sys.intern(value) if type(value) is str else value
+
+
 def replace_digits(string_with_digits: str) -> str:
     """Turn all digits to X chars in a string."""
     return DIGIT_REGEX.sub('x', string_with_digits)
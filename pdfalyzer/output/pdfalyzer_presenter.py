@@ -1,11 +1,12 @@
 """
 Handles formatting of console text output for Pdfalyzer class.
 """
-from collections import defaultdict
-from typing import Optional
+from collections import Counter
+from functools import cached_property
+from typing import Dict, List, Optional
 
 import yara
-from anytree import LevelOrderIter, RenderTree, SymlinkNode
+from anytree import RenderTree, SymlinkNode
 from anytree.render import DoubleStyle
 from rich.markup import escape
 from rich.panel import Panel
@@ -18,22 +19,27 @@ from yaralyzer.util.logging import log
 
 from pdfalyzer.binary.binary_scanner import BinaryScanner
 from pdfalyzer.config import PdfalyzerConfig
-from pdfalyzer.decorators.pdf_tree_node import DECODE_FAILURE_LEN
+from pdfalyzer.decorators.pdf_tree_node import DECODE_FAILURE_LEN, PdfTreeNode
 from pdfalyzer.detection.yaralyzer_helper import get_bytes_yaralyzer, get_file_yaralyzer
 from pdfalyzer.helpers.string_helper import pp
 from pdfalyzer.output.layout import (print_fatal_error_panel, print_section_header, print_section_subheader,
      print_section_sub_subheader)
-from pdfalyzer.output.tables.pdf_node_rich_table import generate_rich_tree, get_symlink_representation
+from pdfalyzer.output.tables.pdf_node_rich_table import (SymlinkRepresentation, build_pdf_node_table,
+     build_symlink_panel, generate_rich_tree, get_symlink_representation)
 from pdfalyzer.output.tables.stream_objects_table import stream_objects_table
 from pdfalyzer.output.tables.decoding_stats_table import build_decoding_stats_table
 from pdfalyzer.pdfalyzer import Pdfalyzer
 from pdfalyzer.util.adobe_strings import *
 
+SIMPLE_TREE_LINES_PER_PRINT = 256
+
 
 class PdfalyzerPresenter:
     def __init__(self, pdfalyzer: Pdfalyzer):
         self.pdfalyzer = pdfalyzer
         self.yaralyzer = get_file_yaralyzer(self.pdfalyzer.pdf_path)
+        # Both tree views show every SymlinkNode, keyed by id(symlink_node)
+        self._symlink_reps: Dict[int, SymlinkRepresentation] = {}
 
     def print_everything(self) -> None:
         """Print every kind of analysis on offer to Rich console."""
@@ -49,7 +55,7 @@ class PdfalyzerPresenter:
         print_section_header(f'Document Info for {self.pdfalyzer.pdf_basename}')
         console.print(pp.pformat(self.pdfalyzer.pdf_reader.metadata))
         console.line()
-        console.print(bytes_hashes_table(self.pdfalyzer.pdf_bytes, self.pdfalyzer.pdf_basename))
+        console.print(bytes_hashes_table(self.pdfalyzer.pdf_bytes_info, self.pdfalyzer.pdf_basename))
         console.line()
         console.print(self._stream_objects_table())
         console.line()
@@ -57,25 +63,47 @@ class PdfalyzerPresenter:
     def print_tree(self) -> None:
         """Print the simple view of the PDF tree."""
         print_section_header(f'Simple tree view of {self.pdfalyzer.pdf_basename}')
+        lines: List[Text] = []
 
         for pre, _fill, node in RenderTree(self.pdfalyzer.pdf_tree, style=DoubleStyle):
             if isinstance(node, SymlinkNode):
-                symlink_rep = get_symlink_representation(node.parent, node)
-                console.print(pre + f"[{symlink_rep.style}]{symlink_rep.text}[/{symlink_rep.style}]")
+                symlink_rep = get_symlink_representation(node.parent, node, self._symlink_reps)
+                line = Text(pre).append_text(symlink_rep.text)
+                line.stylize_before(symlink_rep.style, len(pre))
+                lines.append(line)
             else:
-                console.print(Text(pre) + node.__rich__())
+                lines.append(Text(pre) + node.__rich__())
+
+            # Print in chunks so there aren't one print call per node or every line of a big tree held at once
+            if len(lines) == SIMPLE_TREE_LINES_PER_PRINT:
+                console.print(Text("\n").join(lines))
+                lines.clear()
+
+        if lines:
+            console.print(Text("\n").join(lines))
 
         console.print("\n\n")
 
     def print_rich_table_tree(self) -> None:
         """Print the rich view of the PDF tree."""
         print_section_header(f'Rich tree view of {self.pdfalyzer.pdf_basename}')
-        console.print(generate_rich_tree(self.pdfalyzer.pdf_tree))
+        pdf_tree = self.pdfalyzer.pdf_tree
+        console.print(build_pdf_node_table(pdf_tree))
+
+        # One top level subtree at a time so each one's tables can be garbage collected before the next is built
+        for child in pdf_tree.children:
+            if isinstance(child, SymlinkNode):
+                subtree = build_symlink_panel(pdf_tree, child, self._symlink_reps)
+            else:
+                subtree = generate_rich_tree(child, symlink_cache=self._symlink_reps)
+
+            console.print(subtree)
+            del subtree
 
     def print_summary(self) -> None:
         """Print node type counts and so on."""
         print_section_header(f'PDF Node Summary for {self.pdfalyzer.pdf_basename}')
-        console.print_json(data=self._analyze_tree(), sort_keys=True)
+        console.print_json(data=self._tree_analysis, sort_keys=True)
 
     def print_font_info(self, font_idnum=None) -> None:
         """Print informatin about all fonts that appear in this PDF."""
@@ -96,7 +124,7 @@ class PdfalyzerPresenter:
         print_section_header(f'Binary Stream Analysis / Extraction')
         console.print(self._stream_objects_table())
 
-        for node in [n for n in self.pdfalyzer.stream_nodes() if idnum is None or idnum == n.idnum]:
+        for node in [n for n in self._stream_nodes if idnum is None or idnum == n.idnum]:
             node_stream_bytes = node.stream_data
 
             if node_stream_bytes is None or node.stream_length == 0:
@@ -138,7 +166,7 @@ class PdfalyzerPresenter:
         YaralyzerConfig.args.standalone_mode = False
         console.line(2)
 
-        for node in self.pdfalyzer.stream_nodes():
+        for node in self._stream_nodes:
             if node.stream_length == DECODE_FAILURE_LEN:
                 log.warning(f"{node} binary stream could not be extracted")
             elif node.stream_length == 0 or node.stream_data is None:
@@ -152,36 +180,33 @@ class PdfalyzerPresenter:
         console.line(2)
         console.print(Panel(f"Other Relationships", expand=False), style='reverse')
 
-        for node in LevelOrderIter(self.pdfalyzer.pdf_tree):
-            if len(node.non_tree_relationships) == 0:
-                continue
-
+        for node in self._nodes_with_non_tree_relationships:
             console.print("\n")
             console.print(Panel(f"Non tree relationships for {node}", expand=False))
             node.print_non_tree_relationships()
 
-    def _analyze_tree(self) -> dict:
-        """Generate a dict with some basic data points about the PDF tree"""
-        pdf_object_types = defaultdict(int)
-        node_labels = defaultdict(int)
-        keys_encountered = defaultdict(int)
-        node_count = 0
+    # The PDF tree doesn't change after parsing so these walks of it only need to happen once
+    @cached_property
+    def _stream_nodes(self) -> List[PdfTreeNode]:
+        """Nodes containing streams sorted by PDF object ID."""
+        return self.pdfalyzer.stream_nodes()
 
-        for node in self.pdfalyzer.node_iterator():
-            pdf_object_types[type(node.obj).__name__] += 1
-            node_labels[node.label] += 1
-            node_count += 1
+    @cached_property
+    def _nodes_with_non_tree_relationships(self) -> List[PdfTreeNode]:
+        """Nodes (in level order) with at least one non-tree relationship."""
+        return [node for node in self.pdfalyzer.node_iterator() if node.non_tree_relationships]
 
-            if isinstance(node.obj, dict):
-                for k in node.obj.keys():
-                    keys_encountered[k] += 1
+    @cached_property
+    def _tree_analysis(self) -> dict:
+        """Dict with some basic data points about the PDF tree."""
+        nodes = list(self.pdfalyzer.node_iterator())
 
         return {
-            'keys_encountered': keys_encountered,
-            'node_count': node_count,
-            'node_labels': node_labels,
-            'pdf_object_types': pdf_object_types,
+            'keys_encountered': Counter(k for node in nodes if isinstance(node.obj, dict) for k in node.obj),
+            'node_count': len(nodes),
+            'node_labels': Counter(node.label for node in nodes),
+            'pdf_object_types': Counter(type(node.obj).__name__ for node in nodes),
         }
 
     def _stream_objects_table(self) -> Table:
-        return stream_objects_table(self.pdfalyzer.stream_nodes())
+        return stream_objects_table(self._stream_nodes)
@@ -3,6 +3,7 @@ Configurations and methods to help with consistent styling of PDF trees, nodes,
 """
 import re
 from collections import namedtuple
+from functools import lru_cache
 from numbers import Number
 from typing import Any
 
@@ -45,9 +46,9 @@ LABEL_STYLES = [
     [re.compile(f'^{adobe_strings.WIDTHS}'),              'color(67)'],
     [re.compile(f'^{adobe_strings.W}'),                   'color(67)'],
     [re.compile(f'^{adobe_strings.RESOURCES}'),           'magenta'],
-    [re.compile('/(Trailer|Root|Info|Outlines)'),         'bright_green'],
-    [re.compile('/Catalog'),                              'color(47)'],
-    [re.compile('/(Metadata|ViewerPreferences)'),         'color(35)'],
+    [re.compile('^/(Trailer|Root|Info|Outlines)'),        'bright_green'],
+    [re.compile('^/Catalog'),                             'color(47)'],
+    [re.compile('^/(Metadata|ViewerPreferences)'),        'color(35)'],
     [re.compile('^/Contents'),                            'medium_purple1'],
     [re.compile('^/Action'),                              'dark_red'],
     [re.compile('^/Annots'),                              'deep_sky_blue4'],
@@ -68,25 +69,64 @@ LABEL_STYLES += [
 ]
 
 
+def _label_style_alternative(i: int, regex: re.Pattern) -> str:
+    """
+    Lookahead for regex that can be tried from the start of a label (keeping regex's flags) in a named group
+    so get_label_style() can tell which entry in LABEL_STYLES matched from Match.lastgroup.
+    """
+    flags = ''.join(char for char, flag in [('i', re.I), ('m', re.M)] if regex.flags & flag)
+    pattern = f"(?{flags}:{regex.pattern})" if flags else regex.pattern
+
+    # Only patterns that can match somewhere other than the start of the label need to scan forward
+    if not regex.pattern.startswith('^') or regex.flags & re.M:
+        pattern = f"[\\s\\S]*?{pattern}"
+
+    return f"(?P<g{i}>(?={pattern}))"
+
+
+# Every LABEL_STYLES regex in a single regex. Alternatives are tried in order at the start of the label so the
+# winner is the first entry in LABEL_STYLES that would match, same as checking them one by one.
+LABEL_STYLES_REGEX = re.compile('|'.join(_label_style_alternative(i, ls[0]) for i, ls in enumerate(LABEL_STYLES)))
+LABEL_STYLES_BY_GROUP = {f"g{i}": ls[1] for i, ls in enumerate(LABEL_STYLES)}
+
+
 def get_class_style(obj: Any) -> str:
     """Style for various types of data (e.g. DictionaryObject)"""
-    return next((cs.style for cs in NODE_TYPE_STYLES if isinstance(obj, cs.klass)), '')
+    return _class_style(type(obj))
 
 
 def get_class_style_dim(obj: Any) -> str:
     """Dim version of get_class_style() for non primitives, white for primitives"""
-    if isinstance(obj, str):
-        return 'color(244)'
-    elif isinstance(obj, Number):
-        return 'cyan dim'
-    else:
-        return f"{get_class_style(obj)} dim"
+    return _class_style_dim(type(obj))
 
 
 def get_class_style_italic(obj: Any) -> str:
-    return f"{get_class_style(obj)} italic"
+    return _class_style_italic(type(obj))
 
 
+@lru_cache(maxsize=512)
 def get_label_style(label: str) -> str:
     """Lookup a style based on the node's label string (either its type or first address)."""
-    return next((ls[1] for ls in LABEL_STYLES if ls[0].search(label)), DEFAULT_LABEL_STYLE)
+    match = LABEL_STYLES_REGEX.match(label)
+    return LABEL_STYLES_BY_GROUP[match.lastgroup] if match else DEFAULT_LABEL_STYLE
+
+
+# Class styles only depend on the type of the object so they are cached by type.
+@lru_cache(maxsize=64)
+def _class_style(klass: type) -> str:
+    return next((cs.style for cs in NODE_TYPE_STYLES if issubclass(klass, cs.klass)), '')
+
+
+@lru_cache(maxsize=64)
+def _class_style_dim(klass: type) -> str:
+    if issubclass(klass, str):
+        return 'color(244)'
+    elif issubclass(klass, Number):
+        return 'cyan dim'
+    else:
+        return f"{_class_style(klass)} dim"
+
+
+@lru_cache(maxsize=64)
+def _class_style_italic(klass: type) -> str:
+    return f"{_class_style(klass)} italic"
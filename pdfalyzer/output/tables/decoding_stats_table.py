@@ -1,5 +1,7 @@
 from numbers import Number
+from typing import Dict, Tuple
 
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 from yaralyzer.helpers.rich_text_helper import CENTER, na_txt, prefix_with_plain_text_obj
@@ -9,46 +11,67 @@ from pdfalyzer.output.layout import generate_subtable, half_width, pad_header
 
 # Start rainbow colors here
 CHAR_ENCODING_1ST_COLOR_NUMBER = 203
+# Rainbow styles for the encodings, parsed once (every other color from the 1st color up to color(255)).
+# The rainbow starts over for any encodings past the last color.
+CHAR_ENCODING_STYLES = [
+    Style.parse(f"color({color_number})")
+    for color_number in range(CHAR_ENCODING_1ST_COLOR_NUMBER, 256, 2)
+]
 NOT_FOUND_MSG = Text('(not found)', style='grey.dark_italic')
-REGEX_SUBTABLE_COLS = ['Metric', 'Value']
-DECODES_SUBTABLE_COLS = ['Encoding', '#', 'Decoded', '#', 'Forced', '#', 'Failed']
+NOT_FOUND_PATTERN_STYLE = Style.parse('color(235)')
+NOT_FOUND_ROW_STYLE = Style.parse('color(232)')
+REGEX_SUBTABLE_COLS = ('Metric', 'Value')
+DECODES_SUBTABLE_COLS = ('Encoding', '#', 'Decoded', '#', 'Forced', '#', 'Failed')
+
+# Padded headers for the outer table's columns (Padding isn't modified by rendering so they can be shared)
+BYTE_PATTERN_HEADER = pad_header('BYTE PATTERN')
+AGGREGATE_METRICS_HEADER = pad_header('AGGREGATE METRICS')
+PER_ENCODING_METRICS_HEADER = pad_header('PER ENCODING METRICS')
+
+# Names of the numeric attributes of each stats class (every instance of a class has the same ones)
+_numeric_metrics_cache: Dict[type, Tuple[str, ...]] = {}
 
 def build_decoding_stats_table(scanner: 'BinaryScanner') -> Table:
     """Diplay aggregate results on the decoding attempts we made on subsets of scanner.bytes"""
     stats_table = _new_decoding_stats_table(scanner.label.plain if scanner.label else '')
+    add_row = stats_table.add_row
     regexes_not_found_in_stream = []
 
     for pattern, stats in scanner.regex_extraction_stats.items():
         # Set aside the regexes we didn't find so that the ones we did find are at the top of the table
         if stats.match_count == 0:
-            regexes_not_found_in_stream.append([str(pattern), NOT_FOUND_MSG, na_txt()])
+            regexes_not_found_in_stream.append(str(pattern))
             continue
 
         regex_subtable = generate_subtable(cols=REGEX_SUBTABLE_COLS)
         decodes_subtable = generate_subtable(cols=DECODES_SUBTABLE_COLS)
 
         # Bootstrap regex_table with match_count, bytes_count, easy_decode_count, etc.
-        for metric, measure in vars(stats).items():
-            if isinstance(measure, Number):
-                regex_subtable.add_row(metric, str(measure))
+        for metric in _numeric_metrics(stats):
+            regex_subtable.add_row(metric, str(getattr(stats, metric)))
+
+        match_count = stats.match_count
 
         for i, (encoding, encoding_stats) in enumerate(stats.per_encoding_stats.items()):
+            decoded_count = encoding_stats.match_count
+            forced_count = encoding_stats.forced_decode_count
+            failed_count = encoding_stats.undecodable_count
+
             decodes_subtable.add_row(
-                Text(encoding, style=f"color({CHAR_ENCODING_1ST_COLOR_NUMBER + 2 * i})"),
-                str(encoding_stats.match_count),
-                pct_txt(encoding_stats.match_count, stats.match_count),
-                str(encoding_stats.forced_decode_count),
-                pct_txt(encoding_stats.forced_decode_count, stats.match_count),
-                str(encoding_stats.undecodable_count),
-                pct_txt(encoding_stats.undecodable_count, stats.match_count))
+                Text(encoding, style=CHAR_ENCODING_STYLES[i % len(CHAR_ENCODING_STYLES)]),
+                str(decoded_count),
+                pct_txt(decoded_count, match_count),
+                str(forced_count),
+                pct_txt(forced_count, match_count),
+                str(failed_count),
+                pct_txt(failed_count, match_count))
 
         # Add the outer table row - the one with the encoding name and two subtables
-        stats_table.add_row(str(pattern), regex_subtable, decodes_subtable)
+        add_row(str(pattern), regex_subtable, decodes_subtable)
 
     # Append the empty rows for patterns we didn't find in the data
-    for row in regexes_not_found_in_stream:
-        row[0] = Text(row[0], style='color(235)')
-        stats_table.add_row(*row, style='color(232)')
+    for pattern in regexes_not_found_in_stream:
+        add_row(Text(pattern, style=NOT_FOUND_PATTERN_STYLE), NOT_FOUND_MSG, na_txt(), style=NOT_FOUND_ROW_STYLE)
 
     return stats_table
 
@@ -68,10 +91,16 @@ def _new_decoding_stats_table(title) -> Table:
         header_style='color(235) on color(249) reverse',
         title_style='color(249) bold')
 
-    def add_column(header, **kwargs):
-        table.add_column(pad_header(header.upper()), **kwargs)
-
-    add_column('Byte Pattern', vertical='middle', style='color(25) bold reverse', justify='right')
-    add_column('Aggregate Metrics', overflow='fold', justify=CENTER)
-    add_column('Per Encoding Metrics', justify=CENTER)
+    table.add_column(BYTE_PATTERN_HEADER, vertical='middle', style='color(25) bold reverse', justify='right')
+    table.add_column(AGGREGATE_METRICS_HEADER, overflow='fold', justify=CENTER)
+    table.add_column(PER_ENCODING_METRICS_HEADER, justify=CENTER)
     return table
+
+
+def _numeric_metrics(stats: 'RegexMatchMetrics') -> Tuple[str, ...]:
+    """Names of stats' numeric attributes (match_count, bytes_matched, etc.) in the order they were set."""
+    if type(stats) not in _numeric_metrics_cache:
+        metrics = tuple(metric for metric, measure in vars(stats).items() if isinstance(measure, Number))
+        _numeric_metrics_cache[type(stats)] = metrics
+
+    return _numeric_metrics_cache[type(stats)]
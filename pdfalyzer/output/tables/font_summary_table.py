@@ -38,11 +38,13 @@ def font_summary_table(font):
     if font._char_map is not None:
         add_table_row('character mapping count', len(font.character_mapping))
     if font.widths is not None:
-        for k, v in font.width_stats().items():
+        width_stats = font.width_stats()
+
+        for k, v in width_stats.items():
             add_table_row(f"char width {k}", v)
 
         # Check if there's a single number repeated over and over.
-        if len(set(font.widths)) == 1:
+        if width_stats['unique_count'] == 1:
             table.add_row(
                 'char widths',
                 Text(
@@ -54,6 +56,6 @@ def font_summary_table(font):
             add_table_row('char widths', font.widths)
             add_table_row('char widths(sorted)', sorted(font.widths))
 
-    col_0_width = max([len(entry) for entry in table.columns[0]._cells]) + 4
+    col_0_width = max(map(len, table.columns[0]._cells), default=0) + 4
     table.columns[1].max_width = subheading_width() - col_0_width - 3
     return table
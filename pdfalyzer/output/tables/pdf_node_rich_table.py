@@ -1,8 +1,9 @@
 """
 Methods to create the rich table view for a PdfTreeNode.
 """
+from binascii import hexlify
 from collections import namedtuple
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 
 from anytree import SymlinkNode
 from pypdf.generic import StreamObject
@@ -12,7 +13,6 @@ from rich.table import Table
 from rich.text import Text
 from rich.tree import Tree
 from yaralyzer.encoding_detection.character_encodings import NEWLINE_BYTE
-from yaralyzer.helpers.bytes_helper import clean_byte_string, hex_text
 from yaralyzer.helpers.rich_text_helper import size_text
 from yaralyzer.output.rich_console import BYTES_NO_DIM
 from yaralyzer.util.logging import log
@@ -24,50 +24,103 @@ from pdfalyzer.util.adobe_strings import *
 
 # For printing SymlinkNodes
 SymlinkRepresentation = namedtuple('SymlinkRepresentation', ['text', 'style'])
+SYMLINK_ARROW = '=>'
+NON_CHILD_REFERENCE = '(Non Child Reference)'
+
+# Style rich.table.Table draws its header row in
+TABLE_HEADER_STYLE = 'table.header'
 
 HEX = 'Hex'
 STREAM = 'Stream'
 STREAM_PREVIEW_LENGTH_IN_TABLE = 500
-PREVIEW_STYLES = {HEX: BYTES_NO_DIM, STREAM: 'bytes'}
 
+# DANGEROUS_PDF_KEYS is a list because its order matters when scanning binaries; tables and symlinks only need membership
+DANGEROUS_PDF_KEYS_SET = frozenset(DANGEROUS_PDF_KEYS)
+
+
+def get_symlink_representation(
+        from_node,
+        to_node,
+        symlink_cache: Optional[Dict[int, SymlinkRepresentation]] = None
+    ) -> SymlinkRepresentation:
+    """
+    Returns a tuple (symlink Text, style) that can be used for pretty printing, tree creation, etc.
+    The Text is already styled (no markup to render) but 'style' is left for the caller to apply.
+    If a symlink_cache dict is provided the representation will be looked up there (keyed by id(to_node),
+    the SymlinkNode, which only ever has the one parent) before being built and stored there after.
+    Cached Text objects are shared by every caller so they must be copied, not modified.
+    """
+    if symlink_cache is None:
+        return _build_symlink_representation(from_node, to_node)
+
+    if id(to_node) not in symlink_cache:
+        symlink_cache[id(to_node)] = _build_symlink_representation(from_node, to_node)
 
-def get_symlink_representation(from_node, to_node) -> SymlinkRepresentation:
-    """Returns a tuple (symlink_text, style) that can be used for pretty printing, tree creation, etc"""
+    return symlink_cache[id(to_node)]
+
+
+def _build_symlink_representation(from_node, to_node) -> SymlinkRepresentation:
     reference_key = str(to_node.address_of_this_node_in_other(from_node))
     pdf_instruction = root_address(reference_key)  # In case we ended up with a [0] or similar
 
-    if pdf_instruction in DANGEROUS_PDF_KEYS:
+    if pdf_instruction in DANGEROUS_PDF_KEYS_SET:
         symlink_style = 'red_alert'
     else:
         symlink_style = get_label_style(to_node.label) + ' dim'
 
-    symlink_str = f"{escape(reference_key)} [bright_white]=>[/bright_white]"
-    symlink_str += f" {escape(str(to_node.target))} [grey](Non Child Reference)[/grey]"
-    return SymlinkRepresentation(symlink_str, symlink_style)
+    # Build the Text directly so there's no markup to escape and then parse back out again at render time
+    symlink_txt = Text(reference_key).append(' ').append(SYMLINK_ARROW, style='bright_white').append(' ')
+    symlink_txt.append(str(to_node.target)).append(' ').append(NON_CHILD_REFERENCE, style='grey')
+    return SymlinkRepresentation(symlink_txt, symlink_style)
+
 
+def build_symlink_panel(
+        from_node,
+        to_node,
+        symlink_cache: Optional[Dict[int, SymlinkRepresentation]] = None
+    ) -> Panel:
+    """Box around the symlink's representation for the rich tree view."""
+    symlink_rep = get_symlink_representation(from_node, to_node, symlink_cache)
+    return Panel(symlink_rep.text, style=symlink_rep.style, expand=False)
 
-def generate_rich_tree(node: 'PdfTreeNode', tree: Optional[Tree] = None, depth: int = 0) -> Tree:
-    """Recursively generates a rich.tree.Tree object from this node"""
+
+def generate_rich_tree(
+        node: 'PdfTreeNode',
+        tree: Optional[Tree] = None,
+        depth: int = 0,
+        symlink_cache: Optional[Dict[int, SymlinkRepresentation]] = None
+    ) -> Tree:
+    """
+    Generates a rich.tree.Tree object from this node. If a symlink_cache dict is provided it will be
+    passed on to get_symlink_representation().
+    Uses an explicit stack instead of recursion so deeply nested PDFs can't hit the recursion limit.
+    """
     tree = tree or Tree(build_pdf_node_table(node))
+    stack = [(node, tree)]
+
+    while stack:
+        node, branch = stack.pop()
 
-    for child in node.children:
-        if isinstance(child, SymlinkNode):
-            symlink_rep = get_symlink_representation(node, child)
-            tree.add(Panel(symlink_rep.text, style=symlink_rep.style, expand=False))
-            continue
+        for child in node.children:
+            if isinstance(child, SymlinkNode):
+                branch.add(build_symlink_panel(node, child, symlink_cache))
+                continue
 
-        child_branch = tree.add(build_pdf_node_table(child))
-        generate_rich_tree(child, child_branch)
+            stack.append((child, branch.add(build_pdf_node_table(child))))
 
     return tree
 
 
-def build_pdf_node_table(node: 'PdfTreeNode') -> Table:
+def build_pdf_node_table(node: 'PdfTreeNode') -> Union[Table, Text]:
     """
     Generate a Rich table representation of this node's PDF object and its properties.
     Table cols are [title, address, class name] (not exactly headers but sort of).
     Dangerous things like /JavaScript, /OpenAction, Type1 fonts, etc, will be highlighted red.
+    Single element nodes that would only get a one row table get a single line of Text instead.
     """
+    if not isinstance(node.obj, (dict, list)) and node.label == node.known_to_parent_as:
+        return _build_single_element_node_text(node)
+
     title = f"{node.idnum}.{escape(node.label)}"
     table = Table(title, escape(node.tree_address()), pypdf_class_name(node.obj))
     table.columns[0].header_style = f'reverse {get_label_style(node.label)}'
@@ -75,32 +128,49 @@ def build_pdf_node_table(node: 'PdfTreeNode') -> Table:
     table.columns[1].overflow = 'fold'
     table.columns[2].header_style = get_class_style_italic(node.obj)
 
+    # Resolve these once instead of once per row
+    add_row = table.add_row
+    to_table_row = type(node).to_table_row
+
     if node.label != node.known_to_parent_as:
-        table.add_row(Text('AddressInParent', style='grey'), Text(str(node.known_to_parent_as), style='grey'), '')
+        add_row(Text('AddressInParent', style='grey'), Text(str(node.known_to_parent_as), style='grey'), '')
 
     if isinstance(node.obj, dict):
         for k, v in node.obj.items():
-            row = type(node).to_table_row(k, v)
+            row = to_table_row(k, v)
 
             # Make dangerous stuff look dangerous
-            if (k in DANGEROUS_PDF_KEYS) or (node.label == FONT and k == SUBTYPE and v == TYPE1_FONT):
-                table.add_row(*[col.plain for col in row], style='fail')
+            if (k in DANGEROUS_PDF_KEYS_SET) or (node.label == FONT and k == SUBTYPE and v == TYPE1_FONT):
+                add_row(*[col.plain for col in row], style='fail')
             else:
-                table.add_row(*row)
+                add_row(*row)
     elif isinstance(node.obj, list):
         for i, item in enumerate(node.obj):
-            table.add_row(*type(node).to_table_row(i, item))
+            add_row(*to_table_row(i, item))
     elif not isinstance(node.obj, StreamObject):
         # Then it's a single element node like a URI, TextString, etc.
-        table.add_row(*type(node).to_table_row('', node.obj, is_single_row_table=True))
+        add_row(*to_table_row('', node.obj, is_single_row_table=True))
 
-    for row in _get_stream_preview_rows(node):
-        row.append(Text(''))
-        table.add_row(*row)
+    # StreamObject is a dict subclass so stream nodes get the key/value rows above as well as a preview
+    if isinstance(node.obj, StreamObject):
+        for row in _get_stream_preview_rows(node):
+            row.append(Text(''))
+            add_row(*row)
 
     return table
 
 
+def _build_single_element_node_text(node: 'PdfTreeNode') -> Text:
+    """One line [title, address, class name] = value representation of a URI, TextString, etc. node."""
+    txt = Text('').append(f"{node.idnum}.{node.label}", style=f'reverse {get_label_style(node.label)}')
+    txt.append(f"  {node.tree_address()}  ", style='dim')
+    txt.append(pypdf_class_name(node.obj), style=get_class_style_italic(node.obj))
+    # Tables draw their headers in the 'table.header' style (bold) underneath the column header styles
+    txt.stylize_before(TABLE_HEADER_STYLE)
+    txt.append('  =  ')
+    return txt.append_text(type(node).to_table_row('', node.obj, is_single_row_table=True)[1])
+
+
 def _get_stream_preview_rows(node: 'PdfTreeNode') -> List[List[Text]]:
     """Get rows that preview the stream data"""
     return_rows: List[List[Text]] = []
@@ -108,33 +178,34 @@ def _get_stream_preview_rows(node: 'PdfTreeNode') -> List[List[Text]]:
     if node.stream_length == 0:
         return return_rows
 
-    if node.stream_data is None or len(node.stream_data) == 0:
+    stream_data = node.stream_data
+    stream_data_length = 0 if stream_data is None else len(stream_data)
+
+    if stream_data_length == 0:
         log.warning(node.__rich__().append(' is a stream object but had no stream data'))
         return return_rows
 
-    stream_preview = node.stream_data[:STREAM_PREVIEW_LENGTH_IN_TABLE]
-    stream_preview_length = len(stream_preview)
+    stream_preview_length = min(stream_data_length, STREAM_PREVIEW_LENGTH_IN_TABLE)
+    stream_preview = stream_data[:stream_preview_length]
 
-    if isinstance(node.stream_data, bytes):
-        stream_preview_hex = hex_text(stream_preview).plain
-        stream_preview_lines = [clean_byte_string(line) for line in stream_preview.split(NEWLINE_BYTE)]
-        stream_preview_string = "\n".join(stream_preview_lines)
+    if isinstance(stream_data, bytes):
+        # Same output as yaralyzer's hex_string() but without building the string byte by byte in python
+        stream_preview_hex = hexlify(stream_preview, ' ').decode('ascii')
+        # repr() gives the same string as yaralyzer's clean_byte_string() without spinning up a Console per line
+        stream_preview_string = "\n".join(repr(line)[2:-1] for line in stream_preview.split(NEWLINE_BYTE))
     else:
-        stream_preview_hex = f"N/A (Stream data is type '{type(node.stream_data).__name__}', not bytes)"
+        stream_preview_hex = f"N/A (Stream data is type '{type(stream_data).__name__}', not bytes)"
         stream_preview_string = stream_preview
 
-    def add_preview_row(hex_or_stream: str, stream_string: str):
-        if stream_preview_length < STREAM_PREVIEW_LENGTH_IN_TABLE:
-            row_label = "Data" if hex_or_stream != HEX else ' View'
-        else:
-            row_label = "Preview" if hex_or_stream != HEX else ' Preview'
-            stream_string += '...'
-
-        style = PREVIEW_STYLES[hex_or_stream]
-        row_label = f"{hex_or_stream}{row_label}\n  ({stream_preview_length} bytes)"
-        return_rows.append([Text(row_label, 'grey'), Text(stream_string, style)])
-
-    add_preview_row(STREAM, stream_preview_string)
-    add_preview_row(HEX, stream_preview_hex)
-    return_rows.append([Text('StreamLength', style='grey'), size_text(len(node.stream_data))])
+    if stream_preview_length < STREAM_PREVIEW_LENGTH_IN_TABLE:
+        stream_label, hex_label, suffix = 'Data', ' View', ''
+    else:
+        stream_label, hex_label, suffix = 'Preview', ' Preview', '...'
+
+    byte_count = f"\n  ({stream_preview_length} bytes)"
+    stream_row_label = Text(f"{STREAM}{stream_label}{byte_count}", 'grey')
+    hex_row_label = Text(f"{HEX}{hex_label}{byte_count}", 'grey')
+    return_rows.append([stream_row_label, Text(stream_preview_string + suffix, 'bytes')])
+    return_rows.append([hex_row_label, Text(stream_preview_hex + suffix, BYTES_NO_DIM)])
+    return_rows.append([Text('StreamLength', style='grey'), size_text(stream_data_length)])
     return return_rows
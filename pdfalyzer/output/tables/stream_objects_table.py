@@ -10,13 +10,20 @@ from yaralyzer.output.file_hashes_table import LEFT
 
 from pdfalyzer.decorators.pdf_tree_node import PdfTreeNode
 
+STREAM_OBJECTS_TABLE_OPTIONS = {
+    'title': ' Embedded Streams',
+    'title_style': 'grey',
+    'title_justify': LEFT,
+}
+
 
 def stream_objects_table(stream_nodes: List[PdfTreeNode]) -> Table:
     """Build a table of stream objects and their lengths."""
-    table = Table('Stream Length', 'Node', title=' Embedded Streams', title_style='grey', title_justify=LEFT)
+    table = Table('Stream Length', 'Node', **STREAM_OBJECTS_TABLE_OPTIONS)
     table.columns[0].justify = 'right'
+    add_row = table.add_row
 
     for node in stream_nodes:
-        table.add_row(size_in_bytes_text(node.stream_length), node.__rich__())
+        add_row(size_in_bytes_text(node.stream_length), node.__rich__())
 
     return table
@@ -1,16 +1,22 @@
 """
 Simple container class for information about a link between two PDF objects.
 """
+import logging
+from functools import lru_cache
 from typing import List, Optional, Union
 
 from pypdf.generic import IndirectObject, PdfObject
 from yaralyzer.util.logging import log
 
-from pdfalyzer.helpers.string_helper import bracketed, is_prefixed_by_any
+from pdfalyzer.helpers.string_helper import bracketed, intern_if_str, is_prefixed_by_any
 from pdfalyzer.util.adobe_strings import *
 
 INCOMPARABLE_PROPS = ['from_obj', 'to_obj']
 
+# Checked for every relationship built while walking the PDF so use sets instead of the adobe_strings lists
+INDETERMINATE_REF_KEYS_SET = frozenset(INDETERMINATE_REF_KEYS)
+NON_TREE_KEYS_SET = frozenset(NON_TREE_KEYS)
+
 
 class PdfObjectRelationship:
     def __init__(
@@ -28,18 +34,19 @@ class PdfObjectRelationship:
         """
         self.from_node = from_node
         self.to_obj = to_obj
-        self.reference_key = reference_key
-        self.address = address
+        # The same keys and addresses (/Kids, /Parent, /Resources[/Font], etc.) come up over and over
+        self.reference_key = intern_if_str(reference_key)
+        self.address = intern_if_str(address)
 
         # Compute tree placement logic booleans
         if (has_indeterminate_prefix(from_node.type) and not isinstance(self.from_node.obj, dict)) \
-                or reference_key in INDETERMINATE_REF_KEYS:
+                or reference_key in INDETERMINATE_REF_KEYS_SET:
             log.info(f"Indeterminate node: {from_node}")
             self.is_indeterminate = True
         else:
             self.is_indeterminate = False
 
-        self.is_link = reference_key in NON_TREE_KEYS or is_prefixed_by_any(from_node.label, LINK_NODE_KEYS)
+        self.is_link = reference_key in NON_TREE_KEYS_SET or is_prefixed_by_any(from_node.label, LINK_NODE_KEYS)
         self.is_parent = reference_key == PARENT or (from_node.type == STRUCT_ELEM and reference_key == P)
 
         # TODO: there can be multiple OBJR refs to the same object... which wouldn't work w/this code
@@ -61,25 +68,36 @@ class PdfObjectRelationship:
         ) -> List['PdfObjectRelationship']:
         """
         Builds list of relationships 'from_node.obj' contains referencing other PDF objects.
-        Initially called with single arg from_node. Other args are employed when recursable
-        types (i.e. list, dict) are recursively scanned.
+        Usually called with single arg from_node. Other args are the object, ref_key and address
+        to start scanning from. Nested lists and dicts are scanned with an explicit stack (not
+        recursion) in the same depth first order a recursive scan would use.
         """
         if from_node is None and from_obj is None:
             raise ValueError("Either :from_node or :from_obj must be provided to get references")
 
         from_obj = from_node.obj if from_obj is None else from_obj
         references: List[PdfObjectRelationship] = []
-
-        if isinstance(from_obj, IndirectObject):
-            references.append(cls(from_node, from_obj, str(ref_key), str(address)))
-        elif isinstance(from_obj, list):
-            for i, item in enumerate(from_obj):
-                references += cls.build_node_references(from_node, item, ref_key or i, _build_address(i, address))
-        elif isinstance(from_obj, dict):
-            for key, val in from_obj.items():
-                references += cls.build_node_references(from_node, val, ref_key or key, _build_address(key, address))
-        else:
-            log.debug(f"Adding no references for PdfObject reference '{ref_key}' -> '{from_obj}'")
+        stack = [(from_obj, ref_key, address)]
+
+        while stack:
+            obj, obj_ref_key, obj_address = stack.pop()
+
+            # Children are pushed in reverse so they are popped in their original order
+            if isinstance(obj, IndirectObject):
+                references.append(cls(from_node, obj, str(obj_ref_key), str(obj_address)))
+            elif isinstance(obj, list):
+                stack.extend(
+                    (item, obj_ref_key or i, _build_address(i, obj_address))
+                    for i, item in reversed(list(enumerate(obj)))
+                )
+            elif isinstance(obj, dict):
+                stack.extend(
+                    (val, obj_ref_key or key, _build_address(key, obj_address))
+                    for key, val in reversed(list(obj.items()))
+                )
+            elif log.isEnabledFor(logging.DEBUG):
+                # Checked first so the message isn't formatted for every number, name, etc. in the PDF
+                log.debug(f"Adding no references for PdfObject reference '{obj_ref_key}' -> '{obj}'")
 
         # Set all returned relationships to originate from top level from_obj before returning
         for ref in references:
@@ -89,16 +107,28 @@ class PdfObjectRelationship:
 
     def __eq__(self, other: 'PdfObjectRelationship') -> bool:
         """Note that equality does not check self.from_obj equality because we don't have the idnum"""
-        for key in [k for k in vars(self).keys() if k not in INCOMPARABLE_PROPS]:
-            if getattr(self, key) != getattr(other, key):
-                return False
-
-        return self.from_node.idnum == other.from_node.idnum
+        return self._comparable_props() == other._comparable_props() \
+            and self.from_node.idnum == other.from_node.idnum
+
+    def _comparable_props(self) -> tuple:
+        """Every property set in __init__ except the INCOMPARABLE_PROPS."""
+        return (
+            self.from_node,
+            self.reference_key,
+            self.address,
+            self.is_indeterminate,
+            self.is_link,
+            self.is_parent,
+            self.is_child
+        )
 
     def __str__(self) -> str:
         return f"{self.from_node} ref_key: {self.reference_key}, addr: {self.address} => nodeID {self.to_obj.idnum}"
 
 
+# The same keys show up under the same addresses over and over again (e.g. /Resources[/Font] in every page).
+# typed=True so a NameObject key doesn't get back the plain str cached for an equal str key (or vice versa).
+@lru_cache(maxsize=8192, typed=True)
 def _build_address(ref_key: Union[str, int], base_address: Optional[str] = None) -> str:
     """
     Append either array index indicators e.g. [5] or reference_keys. reference_keys that appear in a
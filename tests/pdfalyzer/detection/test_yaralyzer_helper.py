@@ -0,0 +1,61 @@
+from copy import copy
+from os import path
+
+import pytest
+from yaralyzer.config import YaralyzerConfig
+from yaralyzer.yaralyzer import Yaralyzer
+
+from pdfalyzer.detection import yaralyzer_helper
+from pdfalyzer.detection.yaralyzer_helper import get_bytes_yaralyzer
+
+
+@pytest.fixture
+def yaralyzer_args(monkeypatch):
+    """Fresh copy of the yaralyzer args and an empty compiled rules cache for each test."""
+    if 'args' not in vars(YaralyzerConfig):
+        YaralyzerConfig.set_default_args()
+
+    args = copy(YaralyzerConfig.args)
+    args.yara_rules_files = None
+    args.no_default_yara_rules = False
+    monkeypatch.setattr(YaralyzerConfig, 'args', args)
+    monkeypatch.setattr(yaralyzer_helper, '_compiled_rules_cache', {})
+    return args
+
+
+def test_compiled_rules_cache(yaralyzer_args, monkeypatch):
+    for_rules_files_calls = []
+    real_for_rules_files = Yaralyzer.for_rules_files
+
+    def for_rules_files(*args):
+        for_rules_files_calls.append(args)
+        return real_for_rules_files(*args)
+
+    monkeypatch.setattr(Yaralyzer, 'for_rules_files', for_rules_files)
+    yaralyzer = get_bytes_yaralyzer(b'first bytes', 'first')
+    cached_yaralyzer = get_bytes_yaralyzer(b'second bytes', 'second')
+    assert len(for_rules_files_calls) == 1
+    assert cached_yaralyzer.rules is yaralyzer.rules
+    assert cached_yaralyzer.rules_label == yaralyzer.rules_label
+    assert cached_yaralyzer.rules_label == ', '.join(yaralyzer_helper.YARA_RULES_FILES)
+    assert cached_yaralyzer.bytes == b'second bytes'
+    assert cached_yaralyzer.scannable_label == 'second'
+
+
+def test_missing_rules_file_exits(yaralyzer_args, tmp_dir, capsys):
+    missing_rules_path = path.join(tmp_dir, 'missing.yara')
+    yaralyzer_args.yara_rules_files = [missing_rules_path]
+
+    with pytest.raises(SystemExit) as e:
+        get_bytes_yaralyzer(b'bytes', 'label')
+
+    assert e.value.code == 1
+    assert missing_rules_path in capsys.readouterr().out
+
+
+def test_rules_paths_not_mutated(yaralyzer_args, additional_yara_rules_path):
+    yaralyzer_args.yara_rules_files = [str(additional_yara_rules_path)]
+    yaralyzer = get_bytes_yaralyzer(b'bytes', 'label')
+    get_bytes_yaralyzer(b'more bytes', 'label')
+    assert yaralyzer_args.yara_rules_files == [str(additional_yara_rules_path)]
+    assert yaralyzer.rules_label.split(', ')[1:] == yaralyzer_helper.YARA_RULES_FILES
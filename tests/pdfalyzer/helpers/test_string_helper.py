@@ -1,5 +1,7 @@
-from pdfalyzer.helpers.string_helper import (all_strings_are_same_ignoring_numbers, is_prefixed_by_any,
-     has_a_common_substring, is_substring_of_longer_strings_in_list, replace_digits)
+from pypdf.generic import NameObject
+
+from pdfalyzer.helpers.string_helper import (all_strings_are_same_ignoring_numbers, intern_if_str,
+     is_prefixed_by_any, has_a_common_substring, is_substring_of_longer_strings_in_list, replace_digits)
 
 TEST_TITLE = "Jacques and Carl's Excellent Adventure"
 
@@ -10,6 +12,13 @@ def test_is_prefixed_by_any():
 
 
 
+def test_intern_if_str():
+    assert intern_if_str(''.join(['/Re', 'sources'])) is intern_if_str('/Resources')
+    name = NameObject('/Resources')
+    assert intern_if_str(name) is name
+    assert intern_if_str(5) == 5
+
+
 def test_replace_digits():
     assert replace_digits('abcd') == 'abcd'
     assert replace_digits('a1b2c3d4e5f6') == 'axbxcxdxexfx'
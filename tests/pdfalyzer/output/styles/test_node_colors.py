@@ -9,3 +9,6 @@ def test_get_class_style():
 
 def test_get_label_style():
     assert get_label_style('/Contents') == 'medium_purple1'
+    assert get_label_style('/Pages') == 'dark_orange3'
+    assert get_label_style('/Page[0]/OpenAction') == 'blink bold red'
+    assert get_label_style('/SomethingElse') == 'yellow'
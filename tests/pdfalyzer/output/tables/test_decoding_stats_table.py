@@ -0,0 +1,90 @@
+from rich.text import Text
+from yaralyzer.output.regex_match_metrics import RegexMatchMetrics
+
+from pdfalyzer.output.tables.decoding_stats_table import CHAR_ENCODING_STYLES, build_decoding_stats_table
+
+
+def test_build_decoding_stats_table():
+    stats = _regex_match_metrics(
+        match_count=4,
+        bytes_matched=40,
+        matches_decoded=3,
+        easy_decode_count=2,
+        forced_decode_count=1,
+        undecodable_count=1
+    )
+
+    stats.per_encoding_stats['utf-8'] = _regex_match_metrics(match_count=3, forced_decode_count=1, undecodable_count=1)
+    stats.per_encoding_stats['ascii'] = _regex_match_metrics(match_count=2, undecodable_count=2)
+    not_found_stats = _regex_match_metrics()
+    stats_table = build_decoding_stats_table(ScannerStub({'not found': not_found_stats, 'found': stats}))
+    assert stats_table.title.plain == 'stream label: Decoding Attempts Summary Statistics'
+    assert [col.header.renderable for col in stats_table.columns] == \
+        ['BYTE PATTERN', 'AGGREGATE METRICS', 'PER ENCODING METRICS']
+
+    # Patterns that were found come first, then the ones that weren't
+    pattern_col, metrics_col, decodes_col = [col._cells for col in stats_table.columns]
+    assert [_plain(cell) for cell in pattern_col] == ['found', 'not found']
+    assert stats_table.rows[0].style is None
+    assert str(stats_table.rows[1].style) == 'color(232)'
+    assert str(pattern_col[1].style) == 'color(235)'
+    assert _plain(metrics_col[1]) == '(not found)'
+    assert _plain(decodes_col[1]) == 'N/A'
+
+    regex_subtable, decodes_subtable = metrics_col[0], decodes_col[0]
+    assert [col.header for col in regex_subtable.columns] == ['Metric', 'Value']
+    assert _subtable_rows(regex_subtable) == [
+        ['match_count', '4'],
+        ['bytes_matched', '40'],
+        ['matches_decoded', '3'],
+        ['easy_decode_count', '2'],
+        ['forced_decode_count', '1'],
+        ['undecodable_count', '1'],
+    ]
+
+    assert [col.header for col in decodes_subtable.columns] == \
+        ['Encoding', '#', 'Decoded', '#', 'Forced', '#', 'Failed']
+    assert _subtable_rows(decodes_subtable) == [
+        ['utf-8', '3', '(75.0%)', '1', '(25.0%)', '1', '(25.0%)'],
+        ['ascii', '2', '(50.0%)', '0', '(0.0%)', '2', '(50.0%)'],
+    ]
+
+    assert [str(cell.style) for cell in decodes_subtable.columns[0]._cells] == ['color(203)', 'color(205)']
+
+
+def test_more_encodings_than_styles():
+    num_encodings = len(CHAR_ENCODING_STYLES) + 3
+    stats = _regex_match_metrics(match_count=1)
+
+    for i in range(num_encodings):
+        stats.per_encoding_stats[f"encoding-{i}"].match_count = 1
+
+    stats_table = build_decoding_stats_table(ScannerStub({'pattern': stats}))
+    encoding_col = stats_table.columns[2]._cells[0].columns[0]
+    assert len(encoding_col._cells) == num_encodings
+    assert encoding_col._cells[-1].style == CHAR_ENCODING_STYLES[num_encodings - 1 - len(CHAR_ENCODING_STYLES)]
+
+
+class ScannerStub:
+    """Just enough of a BinaryScanner for build_decoding_stats_table()."""
+    def __init__(self, regex_extraction_stats: dict):
+        self.label = Text('stream label')
+        self.regex_extraction_stats = regex_extraction_stats
+
+
+def _plain(cell) -> str:
+    return cell.plain if isinstance(cell, Text) else cell
+
+
+def _subtable_rows(table) -> list:
+    """Plain text of each row's cells."""
+    return [[_plain(col._cells[i]) for col in table.columns] for i in range(table.row_count)]
+
+
+def _regex_match_metrics(**counts) -> RegexMatchMetrics:
+    stats = RegexMatchMetrics()
+
+    for metric, count in counts.items():
+        setattr(stats, metric, count)
+
+    return stats
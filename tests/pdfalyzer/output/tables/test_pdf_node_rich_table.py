@@ -0,0 +1,148 @@
+from io import BytesIO, TextIOWrapper
+
+import pytest
+from anytree import SymlinkNode
+from pypdf.generic import DictionaryObject, TextStringObject
+from rich.console import Console
+from rich.markup import escape
+from rich.panel import Panel
+from rich.text import Span, Text
+from rich.theme import Theme
+from rich.tree import Tree
+
+from pdfalyzer.decorators.pdf_tree_node import PdfTreeNode
+from pdfalyzer.output.styles.rich_theme import PDFALYZER_THEME_DICT
+from pdfalyzer.output.tables.pdf_node_rich_table import (build_pdf_node_table, generate_rich_tree,
+     get_symlink_representation)
+from pdfalyzer.util.adobe_strings import TRAILER
+
+
+@pytest.mark.parametrize('encoding', ['utf-8', 'ascii'])
+def test_generate_rich_tree(page_node, encoding):
+    rendered_tree = _render(generate_rich_tree(page_node), encoding)
+    assert rendered_tree == _render(_recursive_rich_tree(page_node), encoding)
+
+    # rich only falls back to its ASCII guides if it's the one drawing them
+    if encoding == 'ascii':
+        assert '+-- ' in rendered_tree
+
+
+def test_generate_rich_tree_symlink_cache(page_node):
+    symlink_cache = {}
+    tree = generate_rich_tree(page_node, symlink_cache=symlink_cache)
+    _nodes, symlink_nodes = _nodes_and_symlinks(page_node)
+    assert symlink_cache.keys() == {id(symlink_node) for symlink_node in symlink_nodes}
+
+    # Second time around every symlink's Text should come out of the cache
+    cached_tree = generate_rich_tree(page_node, symlink_cache=symlink_cache)
+
+    for branch, cached_branch in zip(tree.children, cached_tree.children):
+        if isinstance(branch.label, Panel):
+            assert cached_branch.label.renderable is branch.label.renderable
+
+
+@pytest.mark.parametrize(
+    'reference_key, style',
+    [
+        ('/Resources[/Font][/F1]', 'deep_sky_blue4 bold dim'),
+        ('/OpenAction[0]', 'red_alert'),
+    ]
+)
+def test_get_symlink_representation(reference_key, style):
+    symlink_node = SymlinkNodeStub(reference_key)
+    symlink_rep = get_symlink_representation(None, symlink_node)
+    target = SymlinkNodeStub.target
+    arrow_start = len(reference_key) + 1
+    assert symlink_rep.style == style
+    assert symlink_rep.text.plain == f"{reference_key} => {target} (Non Child Reference)"
+
+    assert symlink_rep.text.spans == [
+        Span(arrow_start, arrow_start + 2, 'bright_white'),
+        Span(len(symlink_rep.text) - len('(Non Child Reference)'), len(symlink_rep.text), 'grey'),
+    ]
+
+    # Same thing the markup version used to produce, brackets and all
+    old_text = Text.from_markup(
+        f"{escape(reference_key)} [bright_white]=>[/bright_white] {escape(target)} [grey](Non Child Reference)[/grey]"
+    )
+    assert symlink_rep.text.plain == old_text.plain
+    assert symlink_rep.text.spans == old_text.spans
+
+
+class SymlinkNodeStub:
+    """Just enough of a SymlinkNode for get_symlink_representation()."""
+    label = '/Font'
+    target = '<5:Font(Dictionary)>'
+
+    def __init__(self, reference_key: str):
+        self.reference_key = reference_key
+
+    def address_of_this_node_in_other(self, _from_node) -> str:
+        return self.reference_key
+
+
+def test_build_pdf_node_table_single_element_node():
+    node = PdfTreeNode(TextStringObject('javascript:history.back()'), '/URI', 865)
+    node.set_parent(PdfTreeNode(DictionaryObject(), TRAILER, 1))
+    node_txt = build_pdf_node_table(node)
+    assert isinstance(node_txt, Text)
+    assert node_txt.plain == '865./URI  /URI  TextString  =  javascript:history.back()'
+
+    console = _console(None)
+    title_style, address_style, class_style, value_style = [
+        node_txt.get_style_at_offset(console, node_txt.plain.index(s))
+        for s in ['865./URI', '/URI  Text', 'TextString', 'javascript']
+    ]
+
+    # The [title, address, class name] part should look like the table header it replaced
+    assert title_style == console.get_style('bold reverse white')
+    assert address_style.bold and address_style.dim
+    assert class_style.bold and class_style.italic
+    assert not value_style.bold
+
+
+def _nodes_and_symlinks(node):
+    """All the PdfTreeNodes and SymlinkNodes in node's subtree (SymlinkNodes aren't followed)."""
+    nodes, symlink_nodes, stack = [], [], [node]
+
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+
+        for child in node.children:
+            (symlink_nodes if isinstance(child, SymlinkNode) else stack).append(child)
+
+    return nodes, symlink_nodes
+
+
+def _recursive_rich_tree(node, tree=None) -> Tree:
+    """The way generate_rich_tree() built the tree before it used an explicit stack."""
+    tree = tree or Tree(build_pdf_node_table(node))
+
+    for child in node.children:
+        if isinstance(child, SymlinkNode):
+            symlink_rep = get_symlink_representation(node, child)
+            tree.add(Panel(symlink_rep.text, style=symlink_rep.style, expand=False))
+        else:
+            _recursive_rich_tree(child, tree.add(build_pdf_node_table(child)))
+
+    return tree
+
+
+def _render(renderable, encoding: str = 'utf-8') -> str:
+    """Render to a file with 'encoding'. Non UTF-8 encodings make rich fall back to ascii_only output."""
+    file = TextIOWrapper(BytesIO(), encoding=encoding)
+    _console(file).print(renderable)
+    file.flush()
+    return file.buffer.getvalue().decode(encoding)
+
+
+def _console(file) -> Console:
+    return Console(
+        file=file,
+        width=120,
+        color_system='256',
+        force_terminal=True,
+        legacy_windows=False,
+        theme=Theme(PDFALYZER_THEME_DICT)
+    )
@@ -1,9 +1,9 @@
 import pytest
 from pypdf import PdfReader
-from pypdf.generic import IndirectObject
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject, NumberObject
 
 from pdfalyzer.helpers.pdf_object_helper import _sort_pdf_object_refs
-from pdfalyzer.pdf_object_relationship import PdfObjectRelationship
+from pdfalyzer.pdf_object_relationship import PdfObjectRelationship, _build_address
 from pdfalyzer.util.adobe_strings import *
 
 FONT_IDS = [5, 9, 11, 14, 20, 22, 24]
@@ -62,5 +62,43 @@ def test_build_node_references(pdf_reader, page_obj, page_node, page_obj_direct_
     assert actual_refs == expected_refs
 
 
+def test_build_node_references_order(pdf_reader, page_node):
+    """References should come out depth first in the order they appear in nested dicts and arrays."""
+    nested_obj = DictionaryObject({
+        NameObject(KIDS): ArrayObject([
+            IndirectObject(9, 0, pdf_reader),
+            DictionaryObject({NameObject(FONT): IndirectObject(5, 0, pdf_reader), NameObject('/Size'): NumberObject(4)}),
+            ArrayObject([IndirectObject(7, 0, pdf_reader), IndirectObject(2, 0, pdf_reader)]),
+        ]),
+        NameObject(ANNOTS): IndirectObject(13, 0, pdf_reader),
+        NameObject(RESOURCES): DictionaryObject({
+            NameObject(XOBJECT): DictionaryObject({NameObject('/Im1'): IndirectObject(11, 0, pdf_reader)}),
+            NameObject(FONT): ArrayObject([IndirectObject(20, 0, pdf_reader), IndirectObject(14, 0, pdf_reader)]),
+        }),
+    })
+
+    refs = PdfObjectRelationship.build_node_references(page_node, nested_obj)
+
+    assert [(ref.reference_key, ref.address, ref.to_obj.idnum) for ref in refs] == [
+        (KIDS, f"{KIDS}[0]", 9),
+        (KIDS, f"{KIDS}[1][{FONT}]", 5),
+        (KIDS, f"{KIDS}[2][0]", 7),
+        (KIDS, f"{KIDS}[2][1]", 2),
+        (ANNOTS, ANNOTS, 13),
+        (RESOURCES, f"{RESOURCES}[{XOBJECT}][/Im1]", 11),
+        (RESOURCES, f"{RESOURCES}[{FONT}][0]", 20),
+        (RESOURCES, f"{RESOURCES}[{FONT}][1]", 14),
+    ]
+
+    assert all(ref.from_obj is nested_obj for ref in refs)
+
+
+def test_build_address_keeps_key_type():
+    """Cached addresses for equal str and NameObject keys shouldn't be mixed up."""
+    assert type(_build_address(FONT, None)) is str
+    assert type(_build_address(NameObject(FONT), None)) is NameObject
+    assert _build_address(NameObject(FONT), RESOURCES) == f"{RESOURCES}[{FONT}]"
+
+
 def test_relationship_equality(page_obj_direct_refs):
     assert page_obj_direct_refs[0] != page_obj_direct_refs[1]